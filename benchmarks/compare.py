@@ -5,9 +5,18 @@ This module provides the core benchmarking functionality that can be used
 both as a standalone script and within pytest tests.
 """
 
-import json
+import array
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import gc
 import logging
-import statistics
+import os
+import sys
+
+# Third-Party
+import ahocorasick  # pyahocorasick package
+import numpy as np
+import orjson
 from pathlib import Path
 from typing import List, Dict, Any, Type, Protocol, runtime_checkable, Optional
 
@@ -23,10 +32,18 @@ from mcpgateway.services.logging_service import LoggingService
 from plugins.deny_filter.deny import DenyListPlugin
 from plugins.deny_filter.deny_ac import DenyListAcPlugin
 from plugins.deny_filter.deny_rust import DenyListPluginRust
+from plugins.deny_filter.deny_rust_daac import DenyListPluginRustDaac
 from plugins.deny_filter.deny_rust_rs import DenyListPluginRustRs
 
-WARMUP_RUNS = 3000
+# Lazy plugin state is forced before timing (prepare() hook plus the probe
+# call per combination), so warmup only needs to warm caches and inline
+# caches rather than hide one-time construction cost.
+WARMUP_RUNS = 200
 BENCHMARK_RUNS = 10000
+# Adaptive warmup: warm in blocks and stop early once a block's coefficient
+# of variation falls below the threshold, capped at warmup_runs iterations.
+WARMUP_BLOCK = 100
+WARMUP_CV_THRESHOLD = 0.02
 CONFIG_FILES = [
     "tests/data/deny_check_config_10.json",
     "tests/data/deny_check_config_100.json",
@@ -37,14 +54,25 @@ ALL_IMPLS: List[Type["PromptPreFetchPlugin"]] = [
     DenyListAcPlugin,
     DenyListPluginRust,
     DenyListPluginRustRs,
+    DenyListPluginRustDaac,
 ]
 
 loggingSvc = LoggingService()
-loggingSvc.get_logger("plugins.deny_filter.deny").setLevel(logging.ERROR)
-loggingSvc.get_logger("plugins.deny_filter.deny_rust").setLevel(logging.ERROR)
-loggingSvc.get_logger("plugins.deny_filter.deny_rust_rs").setLevel(logging.ERROR)
-loggingSvc.get_logger("plugins.deny_filter.deny_rust_daac").setLevel(logging.ERROR)
-loggingSvc.get_logger("plugins.deny_filter.deny_ac").setLevel(logging.ERROR)
+# Fully disable the plugin loggers instead of raising the level: disabled
+# makes logger.warning return immediately, so blocked iterations pay no
+# record construction inside the timed loop.
+for _logger_name in (
+    "plugins.deny_filter.deny",
+    "plugins.deny_filter.deny_rust",
+    "plugins.deny_filter.deny_rust_rs",
+    "plugins.deny_filter.deny_rust_daac",
+    "plugins.deny_filter.deny_ac",
+):
+    _logger = loggingSvc.get_logger(_logger_name)
+    _logger.handlers.clear()
+    _logger.addHandler(logging.NullHandler())
+    _logger.propagate = False
+    _logger.disabled = True
 
 @runtime_checkable
 class PromptPreFetchPlugin(Protocol):
@@ -62,35 +90,283 @@ class PromptPreFetchPlugin(Protocol):
         ...
 
 
+def _call_sync(coro) -> Any:
+    """Drive a coroutine that completes without suspending.
+
+    Args:
+        coro: Coroutine returned by a hook that never awaits I/O.
+
+    Returns:
+        The coroutine's return value.
+
+    Raises:
+        RuntimeError: If the coroutine suspends and needs the event loop.
+    """
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise RuntimeError("coroutine suspended; benchmark it on the event loop")
+
+
+@functools.lru_cache(maxsize=None)
 def load_config(config_path: str) -> Dict[str, Any]:
-    """Load the deny check configuration from JSON file."""
+    """Load the deny check configuration from JSON file.
+
+    Cached per path: each config is parsed once even when serial and
+    parallel passes, or the main loop and a worker on the same host,
+    ask for it again.
+    """
     config_file = Path(config_path)
     if not config_file.exists():
         config_file = Path(__file__).parent.parent / "tests" / "data" / Path(config_path).name
 
-    with open(config_file, "r") as f:
-        return json.load(f)
+    return orjson.loads(config_file.read_bytes())
+
+
+# Below this many deny lists, thread-pool startup costs more than the
+# sequential automaton builds it would overlap.
+_PARALLEL_BUILD_THRESHOLD = 4
 
 
 def create_plugin_instances(
     config: Dict[str, Any], plugin_type: Type[PromptPreFetchPlugin]
 ) -> List[tuple[str, PromptPreFetchPlugin]]:
-    """Create plugin instances for each deny word list."""
-    plugins: List[tuple[str, PromptPreFetchPlugin]] = []
+    """Create plugin instances for each deny word list.
 
-    for deny_list in config["deny_word_lists"]:
+    Large configs build their plugins in a thread pool so automaton
+    construction in the Rust engines can overlap across cores.
+    """
+    # Constant across the loop; build the dotted path once.
+    kind = f"{plugin_type.__module__}.{plugin_type.__name__}"
+
+    def build_one(deny_list: Dict[str, Any]) -> tuple[str, PromptPreFetchPlugin]:
         plugin_config = PluginConfig(
-            name=f"deny_filter_{deny_list['name']}",
-            kind=f"{plugin_type.__module__}.{plugin_type.__name__}",
+            name="deny_filter_" + deny_list["name"],
+            kind=kind,
             hooks=[PromptHookType.PROMPT_PRE_FETCH],
             priority=100,
             config={"words": deny_list["words"]},
         )
+        return (deny_list["name"], plugin_type(config=plugin_config))
+
+    deny_word_lists = config["deny_word_lists"]
+    if len(deny_word_lists) >= _PARALLEL_BUILD_THRESHOLD:
+        with ThreadPoolExecutor() as executor:
+            return list(executor.map(build_one, deny_word_lists))
+    return [build_one(deny_list) for deny_list in deny_word_lists]
+
+
+async def _prepare_combinations(
+    plugins: List[tuple[str, PromptPreFetchPlugin]],
+    sample_texts: List[Dict[str, Any]],
+    config: Dict[str, Any],
+    ctx: PluginContext,
+) -> List[Dict[str, Any]]:
+    """Resolve everything the timed loops need for each combination.
+
+    Builds the shared per-sample payloads, the per-plugin Aho-Corasick
+    expected-block oracles, and probes each hook once to capture the block
+    decision and whether the coroutine completes without suspending.
+
+    Args:
+        plugins: (name, plugin) pairs to benchmark.
+        sample_texts: Sample text entries from the config.
+        config: Full deny check configuration.
+        ctx: Shared plugin context.
+
+    Returns:
+        One entry dict per (plugin, sample) combination.
+    """
+    deny_words_by_name = {
+        deny_list["name"]: deny_list["words"]
+        for deny_list in config["deny_word_lists"]
+    }
+
+    # Expected-block oracles, one Aho-Corasick automaton per plugin so each
+    # sample text is scanned in a single linear pass instead of once per word.
+    # Scan verdicts are memoized per (plugin, text) so duplicate sample texts
+    # are never re-scanned.
+    automatons: Dict[str, ahocorasick.Automaton] = {}
+    expected_block_cache: Dict[tuple[str, str], bool] = {}
+
+    # One interned string object per sample text: every payload arg, oracle
+    # scan and cache key then shares the same object, so equality checks in
+    # the hot path hit CPython's pointer-identity fast path.
+    for sample in sample_texts:
+        sample["text"] = sys.intern(sample["text"])
+
+    # Samples with identical text and verdict measure the same thing;
+    # benchmark only the first of each. Texts are interned, so the set
+    # lookups are pointer comparisons.
+    seen: set[tuple[str, bool]] = set()
+    unique_samples: List[Dict[str, Any]] = []
+    for sample in sample_texts:
+        key = (sample["text"], bool(sample.get("should_block", False)))
+        if key not in seen:
+            seen.add(key)
+            unique_samples.append(sample)
+    sample_texts = unique_samples
+
+    # Payloads depend only on the sample, so build each one once via
+    # model_construct (inputs are under our control, validation is skipped)
+    # and share it across every plugin.
+    payloads = [
+        PromptPrehookPayload.model_construct(
+            prompt_id="benchmark_test",
+            args={
+                "text": sample["text"],
+                "system": sample["text"],
+                "other": sample["text"],
+            },
+        )
+        for sample in sample_texts
+    ]
+
+    entries: List[Dict[str, Any]] = []
+
+    for plugin_name, plugin in plugins:
+        automaton = automatons.get(plugin_name)
+        if automaton is None:
+            automaton = ahocorasick.Automaton()
+            for word in deny_words_by_name[plugin_name]:
+                automaton.add_word(word.lower(), word)
+            automaton.make_automaton()
+            automatons[plugin_name] = automaton
+
+        pre_fetch = plugin.prompt_pre_fetch
+
+        # Force any remaining one-time state (automaton build, FFI symbol
+        # resolution) before the warmup loop.
+        if hasattr(plugin, "prepare"):
+            plugin.prepare()
+
+        for sample, payload in zip(sample_texts, payloads):
+            should_block = sample.get("should_block")
+            if should_block is None:
+                cache_key = (plugin_name, sample["text"])
+                should_block = expected_block_cache.get(cache_key)
+                if should_block is None:
+                    should_block = (
+                        next(automaton.iter(sample["text"].lower()), None) is not None
+                    )
+                    expected_block_cache[cache_key] = should_block
+
+            # The deny hooks do no I/O: when a probe call completes on the
+            # first send, the timed loops can drive the coroutines directly
+            # and keep event-loop dispatch out of the measurement. The probe
+            # also captures the block decision so the timed loops carry no
+            # result inspection.
+            probe = pre_fetch(payload, ctx)
+            try:
+                probe.send(None)
+            except StopIteration as stop:
+                run_sync = True
+                probe_result = stop.value
+            else:
+                probe.close()
+                run_sync = False
+                probe_result = await pre_fetch(payload, ctx)
+
+            entries.append(
+                {
+                    "plugin_name": plugin_name,
+                    "plugin": plugin,
+                    "sample": sample,
+                    "payload": payload,
+                    "pre_fetch": pre_fetch,
+                    "run_sync": run_sync,
+                    "should_block": should_block,
+                    "actual_blocked": probe_result.violation is not None,
+                }
+            )
 
-        plugin = plugin_type(config=plugin_config)
-        plugins.append((deny_list["name"], plugin))
+    return entries
 
-    return plugins
+
+def _summarize_combination(
+    entry: Dict[str, Any], arr: np.ndarray
+) -> Dict[str, Any]:
+    """Reduce one combination's nanosecond timings to a result entry.
+
+    Args:
+        entry: Combination entry from _prepare_combinations.
+        arr: int64 nanosecond timings with warmup already sliced off.
+
+    Returns:
+        The combination result dictionary.
+    """
+    # One sort feeds min/median/p99 by index and one sum covers total/mean,
+    # so the buffer is read twice instead of once per reduction; it stays
+    # cache-resident for both passes.
+    ordered = np.sort(arr)
+    n = len(ordered)
+    p99 = float(ordered[int(0.99 * n)]) / 1000.0
+    if n % 2:
+        median = float(ordered[n // 2]) / 1000.0
+    else:
+        median = float(ordered[n // 2 - 1] + ordered[n // 2]) / 2000.0
+    min_time = float(ordered[0]) / 1000.0
+    total_ns = float(ordered.sum())
+    total_time_combination = total_ns / 1000.0
+    mean = total_ns / n / 1000.0
+
+    sample = entry["sample"]
+    actual_blocked = entry["actual_blocked"]
+    should_block = entry["should_block"]
+
+    return {
+        "plugin_name": entry["plugin_name"],
+        "sample_name": sample["name"],
+        "sample_text_length": len(sample["text"]),
+        "expected_block": should_block,
+        "actual_blocked": actual_blocked,
+        "matches_expected": actual_blocked == should_block,
+        # Raw floats; consumers format with :.2f at print time.
+        "timings": {
+            "median_us": median,
+            "p99_us": p99,
+            "mean_us": mean,
+            "min_us": min_time,
+            "total_us": total_time_combination,
+        },
+    }
+
+
+def _benchmark_batch_path(
+    results: Dict[str, Any],
+    plugins: List[tuple[str, PromptPreFetchPlugin]],
+    sample_texts: List[Dict[str, Any]],
+    benchmark_runs: int,
+    perf,
+) -> None:
+    """Time an optional scan_many batch fast path for plugins that have one.
+
+    Args:
+        results: Results dictionary to record batch throughput into.
+        plugins: (name, plugin) pairs to check.
+        sample_texts: Sample text entries from the config.
+        benchmark_runs: Number of batch invocations to time.
+        perf: Nanosecond timer bound to a local by the caller.
+    """
+    for plugin_name, plugin in plugins:
+        if not hasattr(plugin, "scan_many"):
+            continue
+        # Batch fast path: hand every sample text across the call boundary
+        # once per invocation so marshalling cost is amortized, and report
+        # throughput as amortized per-text microseconds.
+        texts = [sample["text"] for sample in sample_texts]
+        scan_many = plugin.scan_many
+        scan_many(texts)
+        start = perf()
+        for _ in range(benchmark_runs):
+            scan_many(texts)
+        elapsed_ns = perf() - start
+        results.setdefault("batch", {})[plugin_name] = {
+            "texts_per_batch": len(texts),
+            "per_text_us": elapsed_ns / 1000.0 / (benchmark_runs * len(texts)),
+        }
 
 
 async def benchmark_plugin(
@@ -99,84 +375,367 @@ async def benchmark_plugin(
     config: Dict[str, Any],
     warmup_runs: int = WARMUP_RUNS,
     benchmark_runs: int = BENCHMARK_RUNS,
+    out_stream: Optional[Any] = None,
 ) -> Dict[str, Any]:
-    """Benchmark prompt_pre_fetch execution for all combinations."""
+    """Benchmark prompt_pre_fetch execution for all combinations.
+
+    When out_stream (a binary file-like object) is given, full combination
+    results are streamed to it as NDJSON lines and results['combinations']
+    holds only slim verdict records, keeping peak memory flat on long
+    sweeps while validate_results still checks every combination; the
+    summary totals are still aggregated in memory.
+    """
     import time
 
     gctx = GlobalContext(request_id="deny-benchmark")
     ctx = PluginContext(global_context=gctx)
 
     results: Dict[str, Any] = {
-        "total_combinations": len(plugins) * len(sample_texts),
         "warmup_runs": warmup_runs,
         "benchmark_runs": benchmark_runs,
         "total_time_us": 0.0,
         "combinations": [],
     }
 
-    for plugin_name, plugin in plugins:
-        for deny_list in config["deny_word_lists"]:
-            if deny_list["name"] == plugin_name:
-                break
-
-        for sample in sample_texts:
-            should_block = sample.get("should_block", False)
-
-            payload = PromptPrehookPayload(
-                prompt_id="benchmark_test",
-                args={
-                    "text": sample["text"],
-                    "system": sample["text"],
-                    "other": sample["text"],
-                },
+    entries = await _prepare_combinations(plugins, sample_texts, config, ctx)
+    # Counted after preparation so duplicate samples dropped there are not
+    # reported as benchmarked combinations.
+    results["total_combinations"] = len(entries)
+    perf = time.perf_counter_ns
+    total_runs = warmup_runs + benchmark_runs
+
+    for entry in entries:
+        # Bind the hook and payload to locals so the timed loop avoids
+        # repeated dict and attribute lookups.
+        pre_fetch = entry["pre_fetch"]
+        payload = entry["payload"]
+        run_sync = entry["run_sync"]
+
+        # Integer nanosecond timestamps into a preallocated buffer: no
+        # float multiply or list growth inside the timed loop. Warmup runs
+        # through the same fused loop shape and is sliced off afterwards;
+        # it proceeds in blocks and stops early once a block's coefficient
+        # of variation converges, so fast implementations skip most of it.
+        timings_ns = array.array("q", bytes(8 * total_runs))
+
+        # Keep GC pauses and GIL switches out of the measurement window:
+        # collect once up front, then disable the collector and stretch
+        # the switch interval for the duration of the timed loop.
+        gc.collect()
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        old_switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1.0)
+        try:
+            warmed = 0
+            while warmed < warmup_runs:
+                block_end = min(warmed + WARMUP_BLOCK, warmup_runs)
+                if run_sync:
+                    for i in range(warmed, block_end):
+                        start = perf()
+                        _call_sync(pre_fetch(payload, ctx))
+                        timings_ns[i] = perf() - start
+                else:
+                    for i in range(warmed, block_end):
+                        start = perf()
+                        await pre_fetch(payload, ctx)
+                        timings_ns[i] = perf() - start
+                block = np.frombuffer(timings_ns, dtype=np.int64)[warmed:block_end]
+                warmed = block_end
+                block_mean = block.mean()
+                if block_mean > 0 and block.std() / block_mean < WARMUP_CV_THRESHOLD:
+                    break
+
+            if run_sync:
+                for i in range(warmed, warmed + benchmark_runs):
+                    start = perf()
+                    _call_sync(pre_fetch(payload, ctx))
+                    timings_ns[i] = perf() - start
+            else:
+                for i in range(warmed, warmed + benchmark_runs):
+                    start = perf()
+                    await pre_fetch(payload, ctx)
+                    timings_ns[i] = perf() - start
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+            sys.setswitchinterval(old_switch_interval)
+
+        arr = np.frombuffer(timings_ns, dtype=np.int64)[warmed : warmed + benchmark_runs]
+        combination_result = _summarize_combination(entry, arr)
+        combination_result["warmup_used"] = warmed
+
+        if out_stream is not None:
+            out_stream.write(orjson.dumps(combination_result) + b"\n")
+            # Keep a slim record without the timings so validate_results
+            # still sees every verdict; the bulky per-combination data
+            # lives only in the stream.
+            results["combinations"].append(
+                {
+                    "plugin_name": combination_result["plugin_name"],
+                    "sample_name": combination_result["sample_name"],
+                    "matches_expected": combination_result["matches_expected"],
+                }
             )
+        else:
+            results["combinations"].append(combination_result)
+        results["total_time_us"] += combination_result["timings"]["total_us"]
 
-            for _ in range(warmup_runs):
-                await plugin.prompt_pre_fetch(payload, ctx)
-
-            timings_us = []
-            actual_blocked = None
-
-            for i in range(benchmark_runs):
-                start = time.perf_counter()
-                result = await plugin.prompt_pre_fetch(payload, ctx)
-                elapsed = time.perf_counter() - start
-                timings_us.append(elapsed * 1_000_000)
-
-                if i == 0:
-                    actual_blocked = result.violation is not None
-
-            timings_us.sort()
-            median = statistics.median(timings_us)
-            p99 = statistics.quantiles(timings_us, n=100)[-1]
-            mean = statistics.mean(timings_us)
-            min_time = min(timings_us)
-            total_time_combination = sum(timings_us)
-
-            combination_result: Dict[str, Any] = {
-                "plugin_name": plugin_name,
-                "sample_name": sample["name"],
-                "sample_text_length": len(sample["text"]),
-                "expected_block": should_block,
-                "actual_blocked": actual_blocked,
-                "matches_expected": actual_blocked == should_block,
-                "timings": {
-                    "median_us": round(median, 2),
-                    "p99_us": round(p99, 2),
-                    "mean_us": round(mean, 2),
-                    "min_us": round(min_time, 2),
-                    "total_us": round(total_time_combination, 2),
-                },
-            }
+    _benchmark_batch_path(results, plugins, sample_texts, benchmark_runs, perf)
 
-            results["combinations"].append(combination_result)
-            results["total_time_us"] += total_time_combination
+    return results
+
+
+async def benchmark_plugin_interleaved(
+    plugins: List[tuple[str, PromptPreFetchPlugin]],
+    sample_texts: List[Dict[str, Any]],
+    config: Dict[str, Any],
+    warmup_runs: int = WARMUP_RUNS,
+    benchmark_runs: int = BENCHMARK_RUNS,
+) -> Dict[str, Any]:
+    """Benchmark all combinations round-robin instead of back-to-back.
+
+    Each iteration visits every (plugin, sample) combination once, so no
+    combination benefits from 10 000 back-to-back calls warming the branch
+    predictor and instruction cache just for itself. Absolute numbers run
+    slightly higher than benchmark_plugin's, but cache state is uniform
+    across implementations, which makes relative speedups fairer.
+
+    Args:
+        plugins: (name, plugin) pairs to benchmark.
+        sample_texts: Sample text entries from the config.
+        config: Full deny check configuration.
+        warmup_runs: Number of warmup rounds. Defaults to WARMUP_RUNS.
+        benchmark_runs: Number of measured rounds. Defaults to BENCHMARK_RUNS.
+
+    Returns:
+        A results dictionary matching benchmark_plugin's shape.
+    """
+    import time
+
+    gctx = GlobalContext(request_id="deny-benchmark")
+    ctx = PluginContext(global_context=gctx)
+
+    results: Dict[str, Any] = {
+        "warmup_runs": warmup_runs,
+        "benchmark_runs": benchmark_runs,
+        "total_time_us": 0.0,
+        "combinations": [],
+    }
+
+    entries = await _prepare_combinations(plugins, sample_texts, config, ctx)
+    # Counted after preparation so duplicate samples dropped there are not
+    # reported as benchmarked combinations.
+    results["total_combinations"] = len(entries)
+    perf = time.perf_counter_ns
+    total_runs = warmup_runs + benchmark_runs
+
+    # Flat tuples for the hot loop; one timing row per combination.
+    work = [
+        (index, entry["pre_fetch"], entry["payload"], entry["run_sync"])
+        for index, entry in enumerate(entries)
+    ]
+    timings_ns = np.zeros((len(entries), total_runs), dtype=np.int64)
+
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    old_switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1.0)
+    try:
+        for i in range(total_runs):
+            for index, pre_fetch, payload, run_sync in work:
+                start = perf()
+                if run_sync:
+                    _call_sync(pre_fetch(payload, ctx))
+                else:
+                    await pre_fetch(payload, ctx)
+                timings_ns[index, i] = perf() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+        sys.setswitchinterval(old_switch_interval)
+
+    for index, entry in enumerate(entries):
+        combination_result = _summarize_combination(
+            entry, timings_ns[index, warmup_runs:]
+        )
+        results["combinations"].append(combination_result)
+        results["total_time_us"] += combination_result["timings"]["total_us"]
+
+    _benchmark_batch_path(results, plugins, sample_texts, benchmark_runs, perf)
 
     return results
 
 
+def _benchmark_combination_worker(
+    impl_kind: str,
+    config: Dict[str, Any],
+    plugin_name: str,
+    sample: Dict[str, Any],
+    warmup_runs: int,
+    benchmark_runs: int,
+    cpu: Optional[int],
+) -> Dict[str, Any]:
+    """Benchmark a single (plugin, sample) combination in a worker process.
+
+    Args:
+        impl_kind: Dotted path of the implementation class (plugins are not
+            picklable, so each worker instantiates its own).
+        config: Full deny check configuration.
+        plugin_name: Name of the deny word list to benchmark.
+        sample: The sample text entry to benchmark.
+        warmup_runs: Number of warmup runs.
+        benchmark_runs: Number of benchmark runs.
+        cpu: CPU to pin this worker to, or None to leave scheduling alone.
+
+    Returns:
+        A benchmark_plugin results dictionary for the single combination.
+    """
+    import asyncio
+    import importlib
+
+    if cpu is not None and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {cpu})
+
+    module_name, class_name = impl_kind.rsplit(".", 1)
+    impl = getattr(importlib.import_module(module_name), class_name)
+    plugins = [
+        entry
+        for entry in create_plugin_instances(config, impl)
+        if entry[0] == plugin_name
+    ]
+    return asyncio.run(
+        benchmark_plugin(plugins, [sample], config, warmup_runs, benchmark_runs)
+    )
+
+
+def _benchmark_impl_worker(
+    config_path: str,
+    impl_kind: str,
+    warmup_runs: int,
+    benchmark_runs: int,
+    cpu: Optional[int],
+) -> Dict[str, Any]:
+    """Benchmark one (config, implementation) pair in a worker process.
+
+    Args:
+        config_path: Path of the config file to load.
+        impl_kind: Dotted path of the implementation class.
+        warmup_runs: Number of warmup runs.
+        benchmark_runs: Number of benchmark runs.
+        cpu: CPU to pin this worker to, or None to leave scheduling alone.
+
+    Returns:
+        A benchmark_plugin results dictionary for the pair.
+    """
+    import asyncio
+    import importlib
+
+    if cpu is not None and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {cpu})
+
+    module_name, class_name = impl_kind.rsplit(".", 1)
+    impl = getattr(importlib.import_module(module_name), class_name)
+    config = load_config(config_path)
+    plugins = create_plugin_instances(config, impl)
+    return asyncio.run(
+        benchmark_plugin(
+            plugins, config["sample_texts"], config, warmup_runs, benchmark_runs
+        )
+    )
+
+
+def benchmark_plugin_parallel(
+    impl: Type[PromptPreFetchPlugin],
+    sample_texts: List[Dict[str, Any]],
+    config: Dict[str, Any],
+    warmup_runs: int = WARMUP_RUNS,
+    benchmark_runs: int = BENCHMARK_RUNS,
+) -> Dict[str, Any]:
+    """Benchmark all combinations for one implementation across processes.
+
+    The (plugin, sample) combinations are independent, so they are fanned
+    out to one worker process per combination, each pinned to a distinct CPU
+    to reduce scheduler jitter. Concurrent workers share memory bandwidth,
+    so absolute latencies are noisier than a serial run; prefer the serial
+    benchmark_plugin when comparing implementations head to head.
+
+    Args:
+        impl: Implementation class to benchmark.
+        sample_texts: Sample text entries from the config.
+        config: Full deny check configuration.
+        warmup_runs: Number of warmup runs per combination.
+        benchmark_runs: Number of benchmark runs per combination.
+
+    Returns:
+        An aggregated results dictionary matching benchmark_plugin's shape.
+    """
+    import concurrent.futures
+
+    impl_kind = f"{impl.__module__}.{impl.__name__}"
+    combos = [
+        (deny_list["name"], sample)
+        for deny_list in config["deny_word_lists"]
+        for sample in sample_texts
+    ]
+    cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else []
+
+    results: Dict[str, Any] = {
+        "total_combinations": len(combos),
+        "warmup_runs": warmup_runs,
+        "benchmark_runs": benchmark_runs,
+        "total_time_us": 0.0,
+        "combinations": [],
+    }
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        futures = [
+            pool.submit(
+                _benchmark_combination_worker,
+                impl_kind,
+                config,
+                plugin_name,
+                sample,
+                warmup_runs,
+                benchmark_runs,
+                cpus[i % len(cpus)] if cpus else None,
+            )
+            for i, (plugin_name, sample) in enumerate(combos)
+        ]
+        for future in futures:
+            slice_result = future.result()
+            results["combinations"].extend(slice_result["combinations"])
+            results["total_time_us"] += slice_result["total_time_us"]
+
+    return results
+
+
+def _pin_cpu() -> None:
+    """Pin this process to the CPU named by the BENCH_CPU env var.
+
+    Keeps the scheduler from migrating the benchmark between cores, which
+    injects tens-of-microsecond outliers straight into the reported p99.
+    A no-op when BENCH_CPU is unset or the platform lacks affinity support.
+    """
+    try:
+        os.sched_setaffinity(0, {int(os.environ["BENCH_CPU"])})
+    except (AttributeError, KeyError, OSError, ValueError):
+        pass
+
+
+@functools.lru_cache(maxsize=1)
 def get_cpu_info() -> str:
     """Get CPU model information."""
+    # /proc/cpuinfo is a one-shot read on Linux; py-cpuinfo's multi-vendor
+    # probing costs hundreds of ms, so keep it as the fallback only.
+    try:
+        with open("/proc/cpuinfo", "r") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
     try:
         import cpuinfo
         return cpuinfo.get_cpu_info().get('brand_raw', "CPU info unavailable")
@@ -221,17 +780,21 @@ def print_markdown_table(
         word_count = config_result["word_count"]
         results = config_result["results"]
 
-        all_impl_medians = {}
-
-        for impl in impls:
-            impl_name = impl.__name__
-            impl_results = results[impl_name]
-            medians = [
-                c["timings"]["median_us"] for c in impl_results["combinations"]
-            ]
-            all_impl_medians[impl_name] = statistics.median(medians)
+        # Reuse the medians the summary pass already aggregated; only
+        # recompute when called with results that never went through it.
+        avg_medians = config_result.get("avg_medians")
+        if avg_medians is None:
+            avg_medians = {}
+            for impl_name in impl_names:
+                impl_results = results[impl_name]
+                combos = impl_results["combinations"]
+                medians = np.fromiter(
+                    (c["timings"]["median_us"] for c in combos),
+                    dtype=np.float64,
+                    count=len(combos),
+                )
+                avg_medians[impl_name] = float(np.median(medians))
 
-        avg_medians = all_impl_medians
         baseline_median = avg_medians[impl_names[0]]
 
         row_parts = [f"{word_count:<11}"]
@@ -253,16 +816,24 @@ def print_markdown_table(
 async def run_benchmark(
     config_files: Optional[List[str]] = None,
     impls: Optional[List[Type[PromptPreFetchPlugin]]] = None,
-    warmup_runs: int = 0,
-    benchmark_runs: int = 0,
+    warmup_runs: Optional[int] = None,
+    benchmark_runs: Optional[int] = None,
+    parallel: bool = False,
+    interleaved: bool = False,
 ) -> Dict[str, Any]:
     """Run the full benchmark comparison.
 
     Args:
         config_files: List of config file paths. Defaults to CONFIG_FILES.
         impls: List of implementation classes. Defaults to ALL_IMPLS.
-        warmup_runs: Number of warmup runs. Defaults to WARMUP_RUNS.
+        warmup_runs: Warmup iteration cap; 0 disables warmup. Defaults to
+            WARMUP_RUNS.
         benchmark_runs: Number of benchmark runs. Defaults to BENCHMARK_RUNS.
+        parallel: Fan combinations out across processes for wall-clock speed
+            at the cost of noisier absolute latencies. Defaults to False.
+        interleaved: Round-robin combinations per iteration instead of
+            running each back-to-back, for uniform cache state across
+            implementations. Ignored in parallel mode. Defaults to False.
 
     Returns:
         Dictionary containing all benchmark results and metadata.
@@ -271,11 +842,16 @@ async def run_benchmark(
         config_files = CONFIG_FILES
     if impls is None:
         impls = ALL_IMPLS
-    if not warmup_runs:
+    if warmup_runs is None:
         warmup_runs = WARMUP_RUNS
     if not benchmark_runs:
         benchmark_runs = BENCHMARK_RUNS
 
+    # In serial mode the whole measurement benefits from staying on one
+    # core; in parallel mode the workers pin themselves instead.
+    if not parallel:
+        _pin_cpu()
+
     impl_names = [impl.__name__ for impl in impls]
 
     print(f"DENY CHECK BENCHMARK - {len(impl_names)} Implementation Comparison")
@@ -286,8 +862,35 @@ async def run_benchmark(
 
     all_config_results: list[dict[str, Any]] = []
 
+    # In parallel mode every (config, impl) pair is an independent job:
+    # separate worker processes isolate allocator and warmup state per
+    # implementation and keep the Python impls off each other's GIL. Submit
+    # everything up front so the pool stays saturated, then collect below in
+    # the original deterministic order.
+    parallel_futures: Dict[tuple[str, str], Any] = {}
+    pool = None
+    if parallel:
+        import concurrent.futures
+
+        cpus = (
+            sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else []
+        )
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+        for job, (config_path, impl) in enumerate(
+            (cp, im) for cp in config_files for im in impls
+        ):
+            parallel_futures[(config_path, impl.__name__)] = pool.submit(
+                _benchmark_impl_worker,
+                config_path,
+                f"{impl.__module__}.{impl.__name__}",
+                warmup_runs,
+                benchmark_runs,
+                cpus[job % len(cpus)] if cpus else None,
+            )
+
     for config_path in config_files:
         config = load_config(config_path)
+        sample_texts = config["sample_texts"]
 
         word_count = sum(
             len(deny_list["words"]) for deny_list in config["deny_word_lists"]
@@ -297,17 +900,20 @@ async def run_benchmark(
 
         run_results: Dict[str, Any] = {}
 
-        for impl in impls:
-            impl_name = impl.__name__
+        for impl, impl_name in zip(impls, impl_names):
             print(f"\nBenchmarking {impl_name} implementation...")
-            plugins = create_plugin_instances(config, impl)
-            results = await benchmark_plugin(
-                plugins,
-                config["sample_texts"],
-                config,
-                warmup_runs=warmup_runs,
-                benchmark_runs=benchmark_runs,
-            )
+            if parallel:
+                results = parallel_futures[(config_path, impl_name)].result()
+            else:
+                plugins = create_plugin_instances(config, impl)
+                bench = benchmark_plugin_interleaved if interleaved else benchmark_plugin
+                results = await bench(
+                    plugins,
+                    sample_texts,
+                    config,
+                    warmup_runs=warmup_runs,
+                    benchmark_runs=benchmark_runs,
+                )
             run_results[impl_name] = results
 
         all_config_results.append(
@@ -319,6 +925,9 @@ async def run_benchmark(
             }
         )
 
+    if pool is not None:
+        pool.shutdown()
+
     print("\nFINAL SUMMARY - ALL CONFIGURATIONS")
 
     for config_result in all_config_results:
@@ -339,22 +948,31 @@ async def run_benchmark(
         all_impl_p99s: Dict[str, float] = {}
         all_impl_totals: Dict[str, float] = {}
 
-        for impl in impls:
-            impl_name = impl.__name__
+        for impl_name in impl_names:
             impl_results: Dict[str, Any] = results[impl_name]
 
-            medians = [
-                c["timings"]["median_us"] for c in impl_results["combinations"]
-            ]
-            p99s = [c["timings"]["p99_us"] for c in impl_results["combinations"]]
+            combos = impl_results["combinations"]
+            medians = np.fromiter(
+                (c["timings"]["median_us"] for c in combos),
+                dtype=np.float64,
+                count=len(combos),
+            )
+            p99s = np.fromiter(
+                (c["timings"]["p99_us"] for c in combos),
+                dtype=np.float64,
+                count=len(combos),
+            )
 
-            all_impl_medians[impl_name] = statistics.median(medians)
-            all_impl_p99s[impl_name] = statistics.median(p99s)
+            all_impl_medians[impl_name] = float(np.median(medians))
+            all_impl_p99s[impl_name] = float(np.median(p99s))
             all_impl_totals[impl_name] = impl_results["total_time_us"]
 
         avg_medians = all_impl_medians
         avg_p99s = all_impl_p99s
         avg_totals = all_impl_totals
+        # Hand the aggregated medians to print_markdown_table so it does
+        # not traverse the combination lists a second time.
+        config_result["avg_medians"] = avg_medians
 
         metric_col_width = 20
         impl_col_widths = []
@@ -449,10 +1067,57 @@ def validate_results(benchmark_results: Dict[str, Any]) -> None:
 
 
 if __name__ == "__main__":
+    import argparse
     import asyncio
 
+    parser = argparse.ArgumentParser(
+        description="Benchmark Python vs Rust deny list implementations"
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=WARMUP_RUNS,
+        help="warmup iteration cap per combination (adaptive, may stop early)",
+    )
+    parser.add_argument(
+        "--no-warmup",
+        action="store_true",
+        help="skip warmup entirely",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=BENCHMARK_RUNS,
+        help="measured iterations per combination",
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="fan (config, impl) jobs out across processes",
+    )
+    parser.add_argument(
+        "--interleaved",
+        action="store_true",
+        help="round-robin combinations per iteration",
+    )
+    args = parser.parse_args()
+
+    try:
+        # uvloop's C event loop roughly halves await dispatch overhead, so
+        # measured latencies reflect the plugins rather than asyncio itself.
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     async def main():
-        results = await run_benchmark()
+        results = await run_benchmark(
+            warmup_runs=0 if args.no_warmup else args.warmup,
+            benchmark_runs=args.runs,
+            parallel=args.parallel,
+            interleaved=args.interleaved,
+        )
         validate_results(results)
         print("\nAll validations passed!")
 
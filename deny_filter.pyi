@@ -13,12 +13,22 @@ __all__ = [
 class DenyList:
     def __new__(cls, words: typing.Sequence[builtins.str]) -> DenyList:
         r"""
-        constructor
+        constructor;
+        releases the GIL while the automaton is built so construction
+        can overlap across threads
         # Errors
         * aho-corasic errors (too long patterns)
         """
     def is_match(self, s: builtins.str) -> builtins.bool: ...
-    def scan_str(self, txt: builtins.str) -> builtins.bool: ...
+    def scan_str(self, txt: builtins.str) -> builtins.bool:
+        r"""
+        releases the GIL for the duration of the pure-Rust scan
+        """
+    def scan_many(self, texts: typing.Sequence[builtins.str]) -> builtins.list[builtins.bool]:
+        r"""
+        scans a batch of strings, one verdict per input;
+        releases the GIL for the duration of the pure-Rust scan
+        """
     def scan(self, args: dict) -> builtins.bool: ...
     def scan_any(self, value: typing.Any) -> builtins.bool:
         r"""
@@ -29,12 +39,22 @@ class DenyList:
 class DenyListDaac:
     def __new__(cls, words: typing.Sequence[builtins.str]) -> DenyListDaac:
         r"""
-        constructor
+        constructor;
+        releases the GIL while the automaton is built so construction
+        can overlap across threads
         # Errors
         * daachorse errors (e.g. too long patterns)
         """
     def is_match(self, s: builtins.str) -> builtins.bool: ...
-    def scan_str(self, txt: builtins.str) -> builtins.bool: ...
+    def scan_str(self, txt: builtins.str) -> builtins.bool:
+        r"""
+        releases the GIL for the duration of the pure-Rust scan
+        """
+    def scan_many(self, texts: typing.Sequence[builtins.str]) -> builtins.list[builtins.bool]:
+        r"""
+        scans a batch of strings, one verdict per input;
+        releases the GIL for the duration of the pure-Rust scan
+        """
     def scan(self, args: dict) -> builtins.bool: ...
     def scan_any(self, value: typing.Any) -> builtins.bool:
         r"""
@@ -45,12 +65,22 @@ class DenyListDaac:
 class DenyListRs:
     def __new__(cls, words: typing.Sequence[builtins.str]) -> DenyListRs:
         r"""
-        constructor
+        constructor;
+        releases the GIL while the regex set is compiled so construction
+        can overlap across threads
         # Errors
         * regex problems (should not happen with simple match)
         """
     def is_match(self, s: builtins.str) -> builtins.bool: ...
-    def scan_str(self, txt: builtins.str) -> builtins.bool: ...
+    def scan_str(self, txt: builtins.str) -> builtins.bool:
+        r"""
+        releases the GIL for the duration of the pure-Rust scan
+        """
+    def scan_many(self, texts: typing.Sequence[builtins.str]) -> builtins.list[builtins.bool]:
+        r"""
+        scans a batch of strings, one verdict per input;
+        releases the GIL for the duration of the pure-Rust scan
+        """
     def scan(self, args: dict) -> builtins.bool: ...
     def scan_any(self, value: typing.Any) -> builtins.bool: ...
 
@@ -95,7 +95,9 @@ class DenyListAcPlugin(Plugin):
                 if isinstance(value, str) and self._contains_deny_word(value):
                     logger.warning("Deny word detected in prompt argument '%s'", key)
                     return deny_violation(payload)
-        return PromptPrehookResult(modified_payload=payload)
+        # Clean path: skip Pydantic validation, the payload is passed through
+        # unchanged and was validated upstream.
+        return PromptPrehookResult.model_construct(modified_payload=payload)
 
     async def shutdown(self) -> None:
         """Cleanup when plugin shuts down."""
@@ -38,8 +38,19 @@ class DenyListPluginRust(Plugin):
             config: Plugin configuration.
         """
         super().__init__(config)
-        dconfig = DenyListConfig.model_validate(self._config.config)
-        self._deny_list: Any = DenyList(dconfig.words)
+        self._dconfig = DenyListConfig.model_validate(self._config.config)
+        self._deny_list: Any = DenyList(self._dconfig.words)
+
+    def scan_many(self, texts: list[str]) -> list[bool]:
+        """Scan a batch of texts with a single call into the Rust extension.
+
+        Args:
+            texts: Texts to scan.
+
+        Returns:
+            One verdict per text, True where a deny word was found.
+        """
+        return self._deny_list.scan_many(texts)
 
     async def prompt_pre_fetch(
         self, payload: PromptPrehookPayload, _context: PluginContext
@@ -56,4 +67,6 @@ class DenyListPluginRust(Plugin):
         if payload.args and self._deny_list.scan_any(payload.args):
             logger.warning("Deny word detected in prompt")
             return deny_violation(payload)
-        return PromptPrehookResult(modified_payload=payload)
+        # Clean path: skip Pydantic validation, the payload is passed through
+        # unchanged and was validated upstream.
+        return PromptPrehookResult.model_construct(modified_payload=payload)
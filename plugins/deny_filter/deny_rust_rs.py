@@ -17,7 +17,6 @@ from deny_filter import DenyListRs
 from mcpgateway.plugins.framework import PluginConfig
 from mcpgateway.services.logging_service import LoggingService
 
-from plugins.deny_filter.deny import DenyListConfig
 from plugins.deny_filter.deny_rust import DenyListPluginRust
 
 # Initialize logging service first
@@ -35,5 +34,6 @@ class DenyListPluginRustRs(DenyListPluginRust):
             config: Plugin configuration.
         """
         super().__init__(config)
-        self._dconfig = DenyListConfig.model_validate(self._config.config)
+        # self._dconfig was validated by DenyListPluginRust.__init__;
+        # only the engine differs here.
         self._deny_list: Any = DenyListRs(self._dconfig.words)
@@ -14,6 +14,16 @@ from mcpgateway.plugins.framework import (
 )
 
 
+# The violation never varies, so validate it once at import time and hand
+# out cheap copies instead of running Pydantic validation per blocked call.
+_DENY_VIOLATION = PluginViolation(
+    reason="Prompt not allowed",
+    description="A deny word was found in the prompt",
+    code="deny",
+    details={},
+)
+
+
 def deny_violation(payload: PromptPrehookPayload) -> PromptPrehookResult:
     """Create a prompt prehook result indicating a deny word violation.
 
@@ -23,13 +33,11 @@ def deny_violation(payload: PromptPrehookPayload) -> PromptPrehookResult:
     Returns:
         A PromptPrehookResult with violation details and processing halted.
     """
-    return PromptPrehookResult(
+    # model_construct skips validation: the payload was validated upstream.
+    # model_copy gives each result its own violation (and details dict), so
+    # downstream consumers annotating it cannot leak state across requests.
+    return PromptPrehookResult.model_construct(
         modified_payload=payload,
-        violation=PluginViolation(
-            reason="Prompt not allowed",
-            description="A deny word was found in the prompt",
-            code="deny",
-            details={},
-        ),
+        violation=_DENY_VIOLATION.model_copy(deep=True),
         continue_processing=False,
     )
@@ -25,29 +25,42 @@ impl Matcher for DenyList {
 #[gen_stub_pymethods]
 #[pymethods]
 impl DenyList {
-    /// constructor
+    /// constructor;
+    /// releases the GIL while the automaton is built so construction
+    /// can overlap across threads
     /// # Errors
     /// * aho-corasic errors (too long patterns)
     #[new]
-    pub fn new(words: Vec<String>) -> PyResult<Self> {
-        // Store deny words in lowercase for case-insensitive matching
-        let words_lower: Vec<String> = words.into_iter().map(|w| w.to_lowercase()).collect();
+    pub fn new(py: Python<'_>, words: Vec<String>) -> PyResult<Self> {
+        py.detach(|| {
+            // Store deny words in lowercase for case-insensitive matching
+            let words_lower: Vec<String> = words.into_iter().map(|w| w.to_lowercase()).collect();
 
-        let ac = AhoCorasick::builder()
-            .match_kind(MatchKind::LeftmostFirst)
-            .build(words_lower)
-            .map_err(build_error)?;
+            let ac = AhoCorasick::builder()
+                .match_kind(MatchKind::LeftmostFirst)
+                .build(words_lower)
+                .map_err(build_error)?;
 
-        Ok(Self { ac })
+            Ok(Self { ac })
+        })
     }
 
     #[must_use]
     pub fn is_match(&self, s: &str) -> bool {
         Matcher::is_match(self, s)
     }
+    /// releases the GIL for the duration of the pure-Rust scan
     #[must_use]
-    pub fn scan_str(&self, txt: &str) -> bool {
-        Matcher::scan_str(self, txt)
+    pub fn scan_str(&self, py: Python<'_>, txt: &str) -> bool {
+        py.detach(|| Matcher::scan_str(self, txt))
+    }
+    /// scans a batch of strings, one verdict per input;
+    /// releases the GIL for the duration of the pure-Rust scan
+    #[must_use]
+    // PyO3 extraction hands us an owned Vec; borrowing is not an option here
+    #[allow(clippy::needless_pass_by_value)]
+    pub fn scan_many(&self, py: Python<'_>, texts: Vec<String>) -> Vec<bool> {
+        py.detach(|| Matcher::scan_many(self, &texts))
     }
     #[must_use]
     pub fn scan(&self, args: &Bound<'_, PyDict>) -> bool {
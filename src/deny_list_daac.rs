@@ -3,53 +3,88 @@ use crate::matcher::Matcher;
 use daachorse::DoubleArrayAhoCorasick as Daac;
 use daachorse::DoubleArrayAhoCorasickBuilder as DaacBld;
 use daachorse::MatchKind::LeftmostFirst;
+use daachorse::charwise::CharwiseDoubleArrayAhoCorasick as CharDaac;
+use daachorse::charwise::CharwiseDoubleArrayAhoCorasickBuilder as CharDaacBld;
 use pyo3::prelude::*;
 use pyo3::pyclass;
 use pyo3::types::PyDict;
 use pyo3_stub_gen::derive::{gen_stub_pyclass, gen_stub_pymethods};
 
+/// Bytewise daachorse is fastest on ASCII pattern sets, charwise wins
+/// once patterns contain multi-byte UTF-8; the variant is picked per
+/// deny list at build time.
+pub enum DaacEngine {
+    Bytewise(Daac<usize>),
+    Charwise(CharDaac<usize>),
+}
+
 #[gen_stub_pyclass]
 #[pyclass(skip_from_py_object)]
 pub struct DenyListDaac {
-    pub daac: Daac<usize>,
+    pub daac: DaacEngine,
 }
 
 impl Matcher for DenyListDaac {
     /// implements match with daachorse
     fn is_match(&self, s: &str) -> bool {
-        self.daac
-            .leftmost_find_iter(&s.to_lowercase())
-            .next()
-            .is_some()
+        let lower = s.to_lowercase();
+        match &self.daac {
+            DaacEngine::Bytewise(daac) => daac.leftmost_find_iter(&lower).next().is_some(),
+            DaacEngine::Charwise(daac) => daac.leftmost_find_iter(&lower).next().is_some(),
+        }
     }
 }
 
 #[gen_stub_pymethods]
 #[pymethods]
 impl DenyListDaac {
-    /// constructor
+    /// constructor;
+    /// releases the GIL while the automaton is built so construction
+    /// can overlap across threads
     /// # Errors
     /// * daachorse errors (e.g. too long patterns)
     #[new]
-    pub fn new(words: Vec<String>) -> PyResult<Self> {
-        // Store deny words in lowercase for case-insensitive matching
-        let words_lower: Vec<String> = words.into_iter().map(|w| w.to_lowercase()).collect();
+    pub fn new(py: Python<'_>, words: Vec<String>) -> PyResult<Self> {
+        py.detach(|| {
+            // Store deny words in lowercase for case-insensitive matching
+            let words_lower: Vec<String> = words.into_iter().map(|w| w.to_lowercase()).collect();
 
-        let daac = DaacBld::new()
-            .match_kind(LeftmostFirst)
-            .build(&words_lower)
-            .map_err(build_error)?;
+            let daac = if words_lower.iter().all(|w| w.is_ascii()) {
+                DaacEngine::Bytewise(
+                    DaacBld::new()
+                        .match_kind(LeftmostFirst)
+                        .build(&words_lower)
+                        .map_err(build_error)?,
+                )
+            } else {
+                DaacEngine::Charwise(
+                    CharDaacBld::new()
+                        .match_kind(LeftmostFirst)
+                        .build(&words_lower)
+                        .map_err(build_error)?,
+                )
+            };
 
-        Ok(Self { daac })
+            Ok(Self { daac })
+        })
     }
 
     #[must_use]
     pub fn is_match(&self, s: &str) -> bool {
         Matcher::is_match(self, s)
     }
+    /// releases the GIL for the duration of the pure-Rust scan
+    #[must_use]
+    pub fn scan_str(&self, py: Python<'_>, txt: &str) -> bool {
+        py.detach(|| Matcher::scan_str(self, txt))
+    }
+    /// scans a batch of strings, one verdict per input;
+    /// releases the GIL for the duration of the pure-Rust scan
     #[must_use]
-    pub fn scan_str(&self, txt: &str) -> bool {
-        Matcher::scan_str(self, txt)
+    // PyO3 extraction hands us an owned Vec; borrowing is not an option here
+    #[allow(clippy::needless_pass_by_value)]
+    pub fn scan_many(&self, py: Python<'_>, texts: Vec<String>) -> Vec<bool> {
+        py.detach(|| Matcher::scan_many(self, &texts))
     }
     #[must_use]
     pub fn scan(&self, args: &Bound<'_, PyDict>) -> bool {
@@ -23,28 +23,41 @@ impl Matcher for DenyListRs {
 #[gen_stub_pymethods]
 #[pymethods]
 impl DenyListRs {
-    /// constructor
+    /// constructor;
+    /// releases the GIL while the regex set is compiled so construction
+    /// can overlap across threads
     /// # Errors
     /// * regex problems (should not happen with simple match)
     #[new]
-    pub fn new(words: Vec<String>) -> PyResult<Self> {
-        // Store deny words in lowercase for case-insensitive matching
-        let patterns: Vec<String> = words
-            .into_iter()
-            .map(|w| escape(&w.to_lowercase()))
-            .collect();
+    pub fn new(py: Python<'_>, words: Vec<String>) -> PyResult<Self> {
+        py.detach(|| {
+            // Store deny words in lowercase for case-insensitive matching
+            let patterns: Vec<String> = words
+                .into_iter()
+                .map(|w| escape(&w.to_lowercase()))
+                .collect();
 
-        let rs = RegexSet::new(patterns).map_err(build_error)?;
+            let rs = RegexSet::new(patterns).map_err(build_error)?;
 
-        Ok(Self { rs })
+            Ok(Self { rs })
+        })
     }
     #[must_use]
     pub fn is_match(&self, s: &str) -> bool {
         Matcher::is_match(self, s)
     }
+    /// releases the GIL for the duration of the pure-Rust scan
     #[must_use]
-    pub fn scan_str(&self, txt: &str) -> bool {
-        Matcher::scan_str(self, txt)
+    pub fn scan_str(&self, py: Python<'_>, txt: &str) -> bool {
+        py.detach(|| Matcher::scan_str(self, txt))
+    }
+    /// scans a batch of strings, one verdict per input;
+    /// releases the GIL for the duration of the pure-Rust scan
+    #[must_use]
+    // PyO3 extraction hands us an owned Vec; borrowing is not an option here
+    #[allow(clippy::needless_pass_by_value)]
+    pub fn scan_many(&self, py: Python<'_>, texts: Vec<String>) -> Vec<bool> {
+        py.detach(|| Matcher::scan_many(self, &texts))
     }
     #[must_use]
     pub fn scan(&self, args: &Bound<'_, PyDict>) -> bool {
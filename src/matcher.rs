@@ -9,6 +9,12 @@ pub trait Matcher {
         self.is_match(txt)
     }
 
+    /// Shared logic: Scans a batch of strings in one call,
+    /// returning one verdict per input
+    fn scan_many(&self, texts: &[String]) -> Vec<bool> {
+        texts.iter().map(|t| self.is_match(t)).collect()
+    }
+
     /// Shared logic: Scans single level dictionary
     fn scan(&self, args: &Bound<'_, PyDict>) -> bool {
         for value in args.values() {
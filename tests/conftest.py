@@ -1,6 +1,6 @@
 """Pytest configuration for automatic benchmark comparison."""
 
-from statistics import mean
+import math
 
 
 def pytest_terminal_summary(terminalreporter, exitstatus, config):
@@ -17,24 +17,32 @@ def pytest_terminal_summary(terminalreporter, exitstatus, config):
     if not benchmarks:
         return
 
-    # Separate Python and Rust benchmarks
-    python_benchmarks = [b for b in benchmarks if "python" in b.name.lower()]
-    rust_benchmarks = [b for b in benchmarks if "rust" in b.name.lower()]
-
-    if not python_benchmarks or not rust_benchmarks:
+    # Partition into Python and Rust benchmarks and accumulate their
+    # statistics in the same single pass.
+    python_count = rust_count = 0
+    python_sum = rust_sum = 0.0
+    python_min = rust_min = math.inf
+    python_max = rust_max = -math.inf
+
+    for benchmark in benchmarks:
+        name = benchmark.name.lower()
+        time = benchmark.stats.mean
+        if "python" in name:
+            python_count += 1
+            python_sum += time
+            python_min = min(python_min, time)
+            python_max = max(python_max, time)
+        elif "rust" in name:
+            rust_count += 1
+            rust_sum += time
+            rust_min = min(rust_min, time)
+            rust_max = max(rust_max, time)
+
+    if not python_count or not rust_count:
         return
 
-    # Calculate aggregate statistics
-    python_times = [b.stats.mean for b in python_benchmarks]
-    rust_times = [b.stats.mean for b in rust_benchmarks]
-
-    python_mean = mean(python_times)
-    python_min = min(python_times)
-    python_max = max(python_times)
-
-    rust_mean = mean(rust_times)
-    rust_min = min(rust_times)
-    rust_max = max(rust_times)
+    python_mean = python_sum / python_count
+    rust_mean = rust_sum / rust_count
 
     speedup = python_mean / rust_mean if rust_mean > 0 else 0
 
@@ -47,14 +55,14 @@ def pytest_terminal_summary(terminalreporter, exitstatus, config):
     tr.write_line(f"  Mean:  {python_mean*1e6:>10.2f} μs")
     tr.write_line(f"  Min:   {python_min*1e6:>10.2f} μs")
     tr.write_line(f"  Max:   {python_max*1e6:>10.2f} μs")
-    tr.write_line(f"  Tests: {len(python_benchmarks):>10}")
+    tr.write_line(f"  Tests: {python_count:>10}")
     tr.write_line("")
 
     tr.write_line("Rust Implementation:", bold=True)
     tr.write_line(f"  Mean:  {rust_mean*1e6:>10.2f} μs")
     tr.write_line(f"  Min:   {rust_min*1e6:>10.2f} μs")
     tr.write_line(f"  Max:   {rust_max*1e6:>10.2f} μs")
-    tr.write_line(f"  Tests: {len(rust_benchmarks):>10}")
+    tr.write_line(f"  Tests: {rust_count:>10}")
     tr.write_line("")
 
     if speedup >= 1:
@@ -38,6 +38,11 @@ fn common_test_logic<T: deny_filter::matcher::Matcher>(deny_list: &T, py: Python
     assert!(deny_list.scan(&dict));
     assert!(deny_list.scan_any(&dict));
 
+    assert_eq!(
+        deny_list.scan_many(&[BLOCK_PROMPT.to_string(), OK_PROMPT.to_string()]),
+        vec![true, false]
+    );
+
     // test non blocked prompts
     assert!(!deny_list.scan_str(OK_PROMPT));
 
@@ -63,18 +68,24 @@ fn test_deny_lists() -> PyResult<()> {
         .iter()
         .map(std::string::ToString::to_string)
         .collect();
-    let deny_list = DenyList::new(words.clone())?;
-    let deny_list_rs = DenyListRs::new(words.clone())?;
-    let deny_list_daac = DenyListDaac::new(words)?;
-
     Python::initialize();
-    Python::attach(|py| {
+    Python::attach(|py| -> PyResult<()> {
+        let deny_list = DenyList::new(py, words.clone())?;
+        let deny_list_rs = DenyListRs::new(py, words.clone())?;
+        let deny_list_daac = DenyListDaac::new(py, words.clone())?;
+
         common_test_logic(&deny_list, py);
         common_test_logic(&deny_list_rs, py);
         common_test_logic(&deny_list_daac, py);
         let module = PyModule::new(py, "modules").unwrap();
         deny_filter_mod(&module).unwrap();
-    });
+
+        // Non-ASCII words select the charwise daachorse variant
+        let deny_list_charwise = DenyListDaac::new(py, vec!["naïve".to_string()])?;
+        assert!(deny_list_charwise.is_match("a NAÏVE plan"));
+        assert!(!deny_list_charwise.is_match(OK_PROMPT));
+        Ok(())
+    })?;
 
     let dummy_error = "mock error";
     let py_err = build_error(dummy_error);
@@ -10,10 +10,14 @@ macro_rules! test_matcher_variant {
             Python::initialize();
             Python::attach(|py| {
                 let words = vec!["BADWORD".to_string()];
-                let matcher = $struct_name::new(words).unwrap();
+                let matcher = $struct_name::new(py, words).unwrap();
 
                 assert!(matcher.is_match("badword"));
-                assert!(matcher.scan_str("badword"));
+                assert!(matcher.scan_str(py, "badword"));
+                assert_eq!(
+                    matcher.scan_many(py, vec!["badword".to_string(), "ok".to_string()]),
+                    vec![true, false]
+                );
 
                 let dict = pyo3::types::PyDict::new(py);
                 dict.set_item("key", "badword").unwrap();